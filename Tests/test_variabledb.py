@@ -1,6 +1,6 @@
 import os
 import pytest
-from variabledb import VariableDB
+from variabledb import VariableDB, save_all_open_files
 
 TEST_DB_FILE = "test_vars.db"
 
@@ -24,6 +24,12 @@ def test_add_and_get_variable(clean_db):
 def test_get_with_default(clean_db):
     assert clean_db.get("missing", default="not found") == "not found"
 
+def test_add_by_name(sample_scope):
+    sample_scope["answer"] = 42
+    db = VariableDB(TEST_DB_FILE, scope=sample_scope)
+    db.add_by_name("answer")
+    assert db["answer"] == 42
+
 def test_add_multiple(clean_db):
     clean_db.add_multiple(a=1, b=2)
     assert clean_db["a"] == 1
@@ -46,6 +52,31 @@ def test_update_no_overwrite(clean_db):
     assert clean_db["a"] == 1  # Should NOT overwrite
     assert clean_db["b"] == 2  # Should be added
 
+def test_save_leaves_no_temp_file(clean_db):
+    clean_db.add(1, name="a")
+    clean_db.save()
+    assert os.path.exists(TEST_DB_FILE)
+    assert not os.path.exists(TEST_DB_FILE + ".tmp")
+
+def test_save_skipped_when_clean(sample_scope):
+    db = VariableDB(TEST_DB_FILE, scope=sample_scope)
+    db.save()
+    assert not os.path.exists(TEST_DB_FILE)  # Nothing changed, nothing written
+
+def test_batch_coalesces_saves(clean_db):
+    with clean_db.batch():
+        clean_db.add(1, name="a")
+        clean_db.save()
+        clean_db.add(2, name="b")
+        clean_db.save()
+        assert not os.path.exists(TEST_DB_FILE)  # Deferred until batch exit
+    assert os.path.exists(TEST_DB_FILE)
+
+def test_save_all_open_files(clean_db):
+    clean_db.add(1, name="a")
+    save_all_open_files()
+    assert os.path.exists(TEST_DB_FILE)
+
 def test_save_and_load(sample_scope):
     db = VariableDB(TEST_DB_FILE, scope=sample_scope)
     db.add("hello", name="greeting")
@@ -57,3 +88,47 @@ def test_save_and_load(sample_scope):
     assert "greeting" in sample_scope  # Scope should be updated
 
     os.remove(TEST_DB_FILE)
+
+def test_scalar_roundtrip(sample_scope):
+    db = VariableDB(TEST_DB_FILE, scope=sample_scope)
+    db.update({"i": -7, "f": 2.5, "s": "text", "t": True, "n": None})
+    db.save()
+
+    new_db = VariableDB(TEST_DB_FILE, scope={})
+    new_db.load()
+    assert new_db.data == {"i": -7, "f": 2.5, "s": "text", "t": True, "n": None}
+
+    os.remove(TEST_DB_FILE)
+
+def test_dill_fallback_roundtrip(sample_scope):
+    db = VariableDB(TEST_DB_FILE, scope=sample_scope)
+    db.add(lambda x: x + 1, name="fn")  # Lambdas need the dill fallback
+    db.save()
+
+    new_db = VariableDB(TEST_DB_FILE, scope={})
+    new_db.load()
+    assert new_db["fn"](1) == 2
+
+    os.remove(TEST_DB_FILE)
+
+def test_surrogate_string_roundtrip(sample_scope):
+    db = VariableDB(TEST_DB_FILE, scope=sample_scope)
+    db.update({"name": "file_\udcff"})  # Not UTF-8 encodable, needs pickle
+    db.save()
+
+    new_db = VariableDB(TEST_DB_FILE, scope={})
+    new_db.load()
+    assert new_db["name"] == "file_\udcff"
+
+    os.remove(TEST_DB_FILE)
+
+def test_non_scalar_roundtrip(sample_scope):
+    db = VariableDB(TEST_DB_FILE, scope=sample_scope)
+    db.add([1, 2, 3], name="my_list")
+    db.save()
+
+    new_db = VariableDB(TEST_DB_FILE, scope={})
+    new_db.load()
+    assert new_db["my_list"] == [1, 2, 3]
+
+    os.remove(TEST_DB_FILE)
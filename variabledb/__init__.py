@@ -0,0 +1,11 @@
+"""
+VariableDB: a lightweight variable-based persistence system.
+
+The implementation lives in `variabledb.core`; this package module only
+re-exports the public API so `from variabledb import VariableDB` keeps
+working.
+"""
+
+from .core import File, VariableDB, configure_logging, save_all_open_files
+
+__all__ = ["File", "VariableDB", "configure_logging", "save_all_open_files"]
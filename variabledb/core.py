@@ -0,0 +1,595 @@
+import io
+import pickle
+import logging
+import os
+import struct
+import sys
+import weakref
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Optional, Iterator, Set, Tuple, Dict
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+def configure_logging(path: str = 'variabledb_log.log', level: int = logging.DEBUG) -> None:
+    """
+    Enable file logging for VariableDB operations.
+
+    Logging is silent by default; call this once to attach a file handler.
+
+    Args:
+        path (str): The log file to write to.
+        level (int): The logging level for the handler.
+    """
+    handler = logging.FileHandler(path, mode='w', encoding='utf-8')
+    handler.setFormatter(logging.Formatter(
+        '%(levelname)s (%(asctime)s): %(message)s (Line: %(lineno)d [%(filename)s])',
+        datefmt='%d/%m/%y %I:%M:%S'
+    ))
+    logger.addHandler(handler)
+    logger.setLevel(level)
+
+
+# Fast persistence format for dicts of plain scalars. Pickle's framing and
+# memo table are overkill for {str: int|float|str|bool|None}, so those are
+# written as a compact length-prefixed record instead. The magic byte b'S'
+# cannot clash with pickle output, which starts with b'\x80' at protocol 2+.
+_SCALAR_MAGIC = b"S"
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+# The shared pickle buffer is allowed to keep this much capacity between
+# saves; anything larger is released after use so one huge save does not
+# pin memory for the rest of the process.
+_SOFT_MAX_BUFFER_LEN = 128 * 1024
+
+
+def _dumps_scalars(data: Dict[str, Any]) -> Optional[bytes]:
+    """
+    Encode a dict of scalar values into a compact binary record.
+
+    Returns None when any key or value does not fit the format; the
+    caller then falls back to pickle.
+    """
+    parts = [_SCALAR_MAGIC]
+    pack = struct.pack
+    for key, value in data.items():
+        if type(key) is not str:
+            return None
+        try:
+            kb = key.encode("utf-8")
+        except UnicodeEncodeError:
+            # Lone surrogates (e.g. from surrogateescape decoding) are
+            # not UTF-8 encodable; pickle persists them fine.
+            return None
+        if len(kb) > 0xFFFF:
+            return None
+        parts.append(pack("<H", len(kb)))
+        parts.append(kb)
+        tp = type(value)
+        if tp is bool:
+            parts.append(b"b" + pack("<?", value))
+        elif tp is int:
+            if not _INT64_MIN <= value <= _INT64_MAX:
+                return None
+            parts.append(b"i" + pack("<q", value))
+        elif tp is float:
+            parts.append(b"f" + pack("<d", value))
+        elif tp is str:
+            try:
+                vb = value.encode("utf-8")
+            except UnicodeEncodeError:
+                return None
+            if len(vb) > 0xFFFFFFFF:
+                return None
+            parts.append(b"s" + pack("<I", len(vb)))
+            parts.append(vb)
+        elif value is None:
+            parts.append(b"n")
+        else:
+            return None
+    return b"".join(parts)
+
+
+def _loads_scalars(blob: bytes) -> Dict[str, Any]:
+    """
+    Decode a record produced by _dumps_scalars.
+    """
+    data: Dict[str, Any] = {}
+    unpack = struct.unpack_from
+    pos = 1
+    end = len(blob)
+    while pos < end:
+        (klen,) = unpack("<H", blob, pos)
+        pos += 2
+        key = blob[pos:pos + klen].decode("utf-8")
+        pos += klen
+        tag = blob[pos:pos + 1]
+        pos += 1
+        value: Any
+        if tag == b"i":
+            (value,) = unpack("<q", blob, pos)
+            pos += 8
+        elif tag == b"f":
+            (value,) = unpack("<d", blob, pos)
+            pos += 8
+        elif tag == b"b":
+            (value,) = unpack("<?", blob, pos)
+            pos += 1
+        elif tag == b"s":
+            (vlen,) = unpack("<I", blob, pos)
+            pos += 4
+            value = blob[pos:pos + vlen].decode("utf-8")
+            pos += vlen
+        else:  # b"n"
+            value = None
+        data[key] = value
+    return data
+
+
+class File:
+    """
+    Descriptor for validating and formatting filenames.
+    Ensures the filename is a string and ends with '.db'.
+    """
+
+    def __init__(self) -> None:
+        self.name: Optional[str] = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type) -> Optional[str]:
+        return instance.__dict__.get(self.name, None)
+
+    def __set__(self, instance: Any, value: str) -> None:
+        if not isinstance(value, str):
+            raise ValueError(f"{self.name} must be a string")
+        instance.__dict__[self.name] = value if value.endswith(".db") else f"{value}.db"
+
+
+class VariableDB:
+    """
+    A simple variable-based database using pickle for persistence.
+    Stores variables by name, allows loading and saving to a file.
+
+    Attributes:
+        filename (str): The path to the .db file.
+        scope (dict): The external scope to bind variables into.
+        data (dict): The actual stored data.
+
+    Note:
+        The instance holds a plain reference to `scope` (dicts cannot be
+        weakly referenced), which keeps every object in that namespace
+        alive for the lifetime of the database. If that matters, prefer
+        `add_by_name()` or pass explicit names to `add()` so the scope
+        is never scanned.
+    """
+
+    filename = File()
+
+    _instances: "weakref.WeakValueDictionary[int, VariableDB]" = weakref.WeakValueDictionary()
+
+    # Reused across saves so each pickle does not allocate a fresh
+    # output buffer; see _SOFT_MAX_BUFFER_LEN for the shrink policy.
+    _save_buf = io.BytesIO()
+
+    def __init__(self, filename: str, *, scope: Dict[str, Any], data: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Initialize the VariableDB.
+
+        Args:
+            filename (str): The file to save/load from.
+            scope (dict): A namespace (usually globals()) for variable resolution.
+            data (dict, optional): Initial data to populate the database.
+        """
+        self.filename = filename
+        self.data = data or {}
+        self.scope = scope
+        self._batch_depth = 0
+        self._pending_save = False
+        self._scope_index: Optional[Dict[int, str]] = None
+        self._scope_seen: Set[str] = set()
+        self._scope_len = -1
+        self._dirty = bool(self.data)
+        VariableDB._instances[id(self)] = self
+
+    def __repr__(self) -> str:
+        return f"VariableDB(filename={self.filename!r}, data_keys={list(self.data.keys())})"
+
+    def __str__(self) -> str:
+        lines = [f"VariableDB: {self.filename}"]
+        if not self.data:
+            lines.append("  (empty)")
+        else:
+            for key, value in self.data.items():
+                lines.append(f"  - {key}: {type(value).__name__} = {repr(value)}")
+        return "\n".join(lines)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, VariableDB):
+            return NotImplemented
+        return self.data == other.data and self.filename == other.filename
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Iterate over (key, value) pairs in the database.
+        """
+        return iter(self.data.items())
+
+    def __delitem__(self, key: str) -> None:
+        """
+        Delete an item by key.
+
+        Args:
+            key (str): The key to delete.
+        """
+        del self.data[key]
+        self._dirty = True
+
+    def __bool__(self) -> bool:
+        """
+        Return True if database contains any data, else False.
+        """
+        return bool(self.data)
+
+    def __enter__(self) -> "VariableDB":
+        """
+        Context manager entry: loads data from file.
+
+        Returns:
+            VariableDB: The instance itself.
+        """
+        self.load()
+        return self
+
+    def __exit__(self, exc_type: Optional[type], exc_val: Optional[BaseException], exc_tb: Optional[Any]) -> None:
+        """
+        Context manager exit: saves data to file if it changed.
+        """
+        self.save()
+
+    def __getitem__(self, key: str) -> Any:
+        """
+        Get an item by key.
+
+        Args:
+            key (str): The key to retrieve.
+
+        Returns:
+            Any: The value stored under the key.
+        """
+        return self.data[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """
+        Set an item by key.
+
+        Args:
+            key (str): The key under which to store the value.
+            value (Any): The value to store.
+        """
+        self.data[sys.intern(key) if type(key) is str else key] = value
+        self._dirty = True
+
+    def __contains__(self, key: str) -> bool:
+        """
+        Check if a key exists in the database.
+
+        Args:
+            key (str): The key to check.
+
+        Returns:
+            bool: True if key exists, False otherwise.
+        """
+        return key in self.data
+
+    def get_variable_name(self, variable: Any) -> Optional[str]:
+        """
+        Attempt to retrieve the variable's name from the scope.
+
+        Args:
+            variable (Any): The variable to look up.
+
+        Returns:
+            Optional[str]: The name of the variable in the scope, if found.
+        """
+        if self._scope_index is None:
+            self._rebuild_index()
+        elif len(self.scope) != self._scope_len:
+            if len(self.scope) > self._scope_len:
+                self._extend_index()
+            else:
+                self._rebuild_index()
+        return self._scope_index.get(id(variable))
+
+    def _rebuild_index(self) -> None:
+        """
+        Rebuild the reverse id()->name index from the current scope.
+        """
+        index: Dict[int, str] = {}
+        for name, val in self.scope.items():
+            index.setdefault(id(val), name)
+        self._scope_index = index
+        self._scope_seen = set(self.scope)
+        self._scope_len = len(self.scope)
+
+    def _extend_index(self) -> None:
+        """
+        Index only the scope names added since the last (re)build, so a
+        monotonically growing scope (a REPL's globals(), say) costs
+        O(new names) per refresh instead of O(whole scope).
+        """
+        seen = self._scope_seen
+        index = self._scope_index
+        for name in self.scope.keys() - seen:
+            index.setdefault(id(self.scope[name]), name)
+            seen.add(name)
+        self._scope_len = len(self.scope)
+
+    def refresh_scope(self) -> None:
+        """
+        Force the reverse scope index to be rebuilt on its next use.
+
+        The index refreshes itself when the scope's length changes; call
+        this after rebinding existing names in the scope so identity
+        lookups see the new values.
+        """
+        self._scope_index = None
+        self._scope_len = -1
+
+    def add(self, variable: Any, name: Optional[str] = None) -> None:
+        """
+        Add a single variable to the database.
+
+        Args:
+            variable (Any): The variable to store.
+            name (Optional[str]): The name to store it under. If None, tries to infer from scope.
+
+        Raises:
+            ValueError: If the name can't be determined.
+        """
+        if name is None:
+            name = self.get_variable_name(variable)
+        if name is None:
+            raise ValueError("Cannot determine variable name to add")
+        self._add_raw(name, variable)
+        self._dirty = True
+
+    def _add_raw(self, name: str, variable: Any) -> None:
+        """
+        Store a variable under an interned name, with no bookkeeping.
+        """
+        self.data[sys.intern(name) if type(name) is str else name] = variable
+
+    def add_by_name(self, name: str) -> None:
+        """
+        Add a variable by looking its name up in the scope.
+
+        This is an O(1) alternative to calling add() without a name,
+        which has to resolve the variable by identity.
+
+        Args:
+            name (str): The variable's name in the scope.
+
+        Raises:
+            KeyError: If the name is not present in the scope.
+        """
+        if name not in self.scope:
+            logger.error(f"(VariableDB.add_by_name) Variable '{name}' not found in scope")
+            raise KeyError(f"Variable '{name}' not found in scope")
+        self._add_raw(name, self.scope[name])
+        self._dirty = True
+
+    @contextmanager
+    def batch(self) -> Iterator["VariableDB"]:
+        """
+        Coalesce save() calls issued inside the block into a single write.
+
+        While the block is active, save() only records that a save is
+        pending; the actual pickle and disk write happen once, when the
+        outermost batch exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._pending_save:
+                self._pending_save = False
+                self.save()
+
+    def add_multiple(self, **variables: Any) -> None:
+        """
+        Add multiple variables at once.
+
+        Args:
+            **variables: Variables to add, with names as keys.
+        """
+        for name, variable in variables.items():
+            self._add_raw(name, variable)
+        if variables:
+            self._dirty = True
+
+    def delete(self, variable_name: str) -> None:
+        """
+        Delete a variable from the database by name.
+
+        Args:
+            variable_name (str): The name of the variable to delete.
+
+        Raises:
+            ValueError: If variable_name is not a string.
+            KeyError: If variable_name does not exist in data.
+        """
+        if not isinstance(variable_name, str):
+            logger.error("(VariableDB.delete) variable name must be string")
+            raise ValueError("variable name must be string")
+        if variable_name not in self.data:
+            logger.error(f"(VariableDB.delete) Variable '{variable_name}' not found in database")
+            raise KeyError(f"Variable '{variable_name}' not found in database")
+        del self.data[variable_name]
+        self._dirty = True
+
+    def clear(self) -> None:
+        """
+        Clear all stored variables.
+        """
+        self.data.clear()
+        self._dirty = True
+
+    def save(self, *, buffer_callback: Optional[Callable[[pickle.PickleBuffer], Any]] = None) -> None:
+        """
+        Save the data to the file using pickle.
+        Falls back to dill for objects pickle cannot handle.
+        Writes to a temporary file first, then renames it into place,
+        so a crash mid-write cannot corrupt an existing database.
+        Inside a batch() block the write is deferred until the block exits.
+        Does nothing when no data has changed since the last save/load.
+
+        Args:
+            buffer_callback (callable, optional): Passed through to
+                pickle.dumps; lets callers capture PickleBuffer views of
+                large bytes-like values out-of-band instead of having
+                them copied into the pickle stream.
+        """
+        if not self._dirty:
+            return
+        if self._batch_depth:
+            self._pending_save = True
+            return
+        try:
+            folder = os.path.dirname(self.filename)
+            if folder and not os.path.exists(folder):
+                os.makedirs(folder)
+            tmp = self.filename + ".tmp"
+            buf = None
+            if buffer_callback is None:
+                buf = _dumps_scalars(self.data)
+            if buf is not None:
+                with memoryview(buf) as view:
+                    self._write_atomic(tmp, view)
+            else:
+                shared = VariableDB._save_buf
+                shared.seek(0)
+                shared.truncate()
+                try:
+                    pickle.dump(self.data, shared, protocol=pickle.HIGHEST_PROTOCOL,
+                                buffer_callback=buffer_callback)
+                except (pickle.PicklingError, TypeError, AttributeError):
+                    import dill
+                    shared.seek(0)
+                    shared.truncate()
+                    dill.dump(self.data, shared)
+                with shared.getbuffer() as view:
+                    self._write_atomic(tmp, view)
+                if shared.tell() > _SOFT_MAX_BUFFER_LEN:
+                    VariableDB._save_buf = io.BytesIO()
+            self._dirty = False
+        except Exception as e:
+            logger.error(f"(VariableDB.save) {e}")
+
+    def _write_atomic(self, tmp: str, view: memoryview) -> None:
+        """
+        Write the blob to the temp file via a raw fd, fsync it, and
+        rename it over the destination.
+        """
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            pos = 0
+            size = len(view)
+            while pos < size:
+                pos += os.write(fd, view[pos:])
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, self.filename)
+
+    def load(self, *, buffers: Optional[Iterable[Any]] = None) -> None:
+        """
+        Load the data from the file using pickle.
+        Falls back to dill for objects pickle cannot handle.
+        Updates the given scope if loading succeeds.
+
+        Args:
+            buffers (iterable, optional): Out-of-band buffers matching a
+                buffer_callback used at save time, passed to pickle.loads.
+        """
+        try:
+            fd = os.open(self.filename, os.O_RDONLY)
+            try:
+                size = os.fstat(fd).st_size
+                blob = os.read(fd, size)
+                while len(blob) < size:
+                    chunk = os.read(fd, size - len(blob))
+                    if not chunk:
+                        break
+                    blob += chunk
+            finally:
+                os.close(fd)
+            if blob[:1] == _SCALAR_MAGIC:
+                self.data = _loads_scalars(blob)
+            else:
+                try:
+                    self.data = pickle.loads(blob, buffers=buffers)
+                except (pickle.UnpicklingError, AttributeError, ImportError):
+                    # dill blobs remap module names (e.g. __builtin__),
+                    # which pickle reports as ModuleNotFoundError.
+                    import dill
+                    self.data = dill.loads(blob)
+            if self.data is not None:
+                self.data = {sys.intern(k) if type(k) is str else k: v
+                             for k, v in self.data.items()}
+                self.scope.update(self.data)
+                self.refresh_scope()
+            self._dirty = False
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"(VariableDB.load) {e}")
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        """
+        Retrieve a value by key, return default if key not found.
+
+        Args:
+            key (str): The key to look up.
+            default (Any, optional): Value to return if key is not found.
+
+        Returns:
+            Any: The value stored under key or default.
+        """
+        return self.data.get(key, default)
+
+
+    def update(self, variables: Dict[str, Any], *, overwrite: bool = True) -> None:
+        """
+        Update the database with multiple variables from a dictionary.
+    
+        Args:
+            variables (Dict[str, Any]): Variables to add/update.
+            overwrite (bool): If False, will not overwrite existing keys.
+        """
+        with self.batch():
+            for key, value in variables.items():
+                if not overwrite and key in self.data:
+                    logger.debug(f"(VariableDB.update) Skipped '{key}' (already exists)")
+                    continue
+                self.data[sys.intern(key) if type(key) is str else key] = value
+                self._dirty = True
+                logger.debug(f"(VariableDB.update) Set '{key}' = {type(value).__name__}")
+
+
+
+def save_all_open_files() -> None:
+    """
+    Save every live VariableDB instance that has unsaved changes.
+
+    Instances are flushed in place, so no database is re-opened and
+    re-read just to be written back out.
+    """
+    for db in list(VariableDB._instances.values()):
+        db.save()